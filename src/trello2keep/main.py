@@ -177,8 +177,7 @@ def extract_list_items(
         click.echo(f'Error: Credentials file {credentials_path} does not exist.')
         return None
 
-    with open(credentials_path, encoding='utf-8') as f:
-        credentials_data = json.load(f)
+    credentials_data = json.loads(credentials_path.read_bytes())
 
     # get the API key, token, and board ID from the credentials file
     if 'trello' not in credentials_data:
@@ -189,32 +188,42 @@ def extract_list_items(
     token = trello.get('token')
 
     client = TrelloClient(api_key, token)
-    data = client.get_board_data(trello_board_id)
-
-    lists = [name.lower() for name in lists]
+    # Only fetch the fields needed to match cards to lists
+    data = client.get_board_data(trello_board_id, fields='name', list_fields='name,closed', card_fields='name,idList')
 
     if 'cards' not in data:
         click.echo('Error: Invalid JSON file.')
         return None
 
-    list_items: dict[str, list[str]] = {name: [] for name in lists}
-
-    list_id_to_name = {it['id']: it['name'].lower() for it in data['lists'] if it['name'].lower() in lists}
-    list_ids = list(list_id_to_name.keys())
-
-    for card in data['cards']:
-        if card['idList'] in list_ids:
-            list_name = list_id_to_name.get(card['idList'])
-            if list_name and list_name in lists:
-                card_name = card['name']
-                list_items[list_name].append(card_name)
+    # Keyed by lowercased list name, also used for case-insensitive matching
+    list_items: dict[str, list[str]] = {name.lower(): [] for name in lists}
+
+    list_id_to_name: dict[str, str] = {}
+    for trello_list in data['lists']:
+        if trello_list.get('closed'):
+            continue
+        lowered_name = trello_list['name'].lower()
+        if lowered_name in list_items:
+            list_id_to_name[trello_list['id']] = lowered_name
+
+    # Bind the lookups to locals, this loop runs once per open card on the board
+    get_list_name = list_id_to_name.get
+    append_to = {name: items.append for name, items in list_items.items()}
+    # No requested list exists on the board: no card can match
+    if list_id_to_name:
+        for card in data['cards']:
+            list_name = get_list_name(card['idList'])
+            if list_name is not None:
+                append_to[list_name](card['name'])
 
     # Convert dict to ListsData object
     lists_data = ListsData(lists=[ListData(name=name, items=items) for name, items in list_items.items()])
     return lists_data
 
 
-def create_google_keep_note(service, note_title: str, list_items: ListsData, text_only: bool = False) -> dict[str, Any]:
+def create_google_keep_note(
+    notes_api, note_title: str, list_items: ListsData, text_only: bool = False
+) -> dict[str, Any]:
     """Create a Google Keep note with organized list items.
 
     This function takes extracted Trello list items and creates a formatted
@@ -222,8 +231,9 @@ def create_google_keep_note(service, note_title: str, list_items: ListsData, tex
     in uppercase, followed by the items from that list.
 
     Args:
-        service: An authenticated Google Keep service client object, typically
-            obtained from get_keep_service().
+        notes_api: The notes resource of an authenticated Google Keep service,
+            i.e. ``get_keep_service().notes()``. Callers creating several notes
+            should obtain it once and reuse it.
         note_title: The title to give the created Google Keep note.
         list_items: A dictionary mapping list names to lists of item names.
             Each key represents a list/section name, and each value is a list
@@ -249,16 +259,14 @@ def create_google_keep_note(service, note_title: str, list_items: ListsData, tex
             'body': {'text': {'text': list_items.as_text()}},
         }
     else:
-        items = []
-        dict_items = list_items.as_dict()
-        for list_name in dict_items.keys():
-            items.append(
-                {
-                    'text': {'text': f'{list_name.upper()}'},
-                    'checked': False,
-                    'childListItems': [{'text': {'text': item}, 'checked': False} for item in dict_items[list_name]],
-                }
-            )
+        items = [
+            {
+                'text': {'text': list_name.upper()},
+                'checked': False,
+                'childListItems': [{'text': {'text': item}, 'checked': False} for item in list_entries],
+            }
+            for list_name, list_entries in list_items.as_dict().items()
+        ]
 
         # Create the note body
         body = {
@@ -266,7 +274,7 @@ def create_google_keep_note(service, note_title: str, list_items: ListsData, tex
             'body': {'list': {'listItems': items}},
         }
 
-    result = service.notes().create(body=body).execute()
+    result = notes_api.create(body=body).execute()
     return result
 
 
@@ -347,7 +355,7 @@ def _apply_ai_filter(
     'trello_board',
     type=str,
 )
-@click.argument('list_items', nargs=-1)
+@click.argument('list_items', nargs=-1, required=True)
 def main(
     credentials: pathlib.Path,
     title: str,
@@ -413,7 +421,8 @@ def _execute_main(
     items = _apply_ai_filter(ai_filter, ai_model, items)
 
     keep_service = get_keep_service(credentials_path=credentials, impersonated_user_email=impersonated_user_email)
-    note = create_google_keep_note(keep_service, title, items, text)
+    notes_api = keep_service.notes()
+    note = create_google_keep_note(notes_api, title, items, text)
     click.secho(f'Google Keep note created: "{note.get("title")}" ({note.get("name")})', fg='green')
 
 
@@ -30,6 +30,8 @@ class TrelloClient:
         api_key (str): The Trello API key for authentication
         token (str): The Trello token for authentication
         base_url (str): The base URL for Trello API endpoints
+        session (requests.Session): Session reused across API calls so
+            consecutive requests share the same HTTP connection
 
     Example:
         >>> client = TrelloClient("your_api_key", "your_token")
@@ -39,6 +41,8 @@ class TrelloClient:
     api_key: str
     token: str
     base_url: str
+    session: requests.Session
+    _board_index: dict[str, str] | None
 
     def __init__(self, api_key: str, token: str):
         """
@@ -53,11 +57,17 @@ class TrelloClient:
         self.api_key = api_key
         self.token = token
         self.base_url = 'https://api.trello.com/1'
+        self.session = requests.Session()
+        self.session.params = {'key': api_key, 'token': token}
+        self._board_index = None
 
     def get_board_id_by_name(self, board_name: str) -> str:
         """
         Find a board ID by its name.
 
+        The member's boards are fetched once and indexed by name; later
+        lookups on the same client are served from that index.
+
         Args:
             board_name (str): The name of the Trello board.
 
@@ -68,32 +78,51 @@ class TrelloClient:
             ValueError: If no board with the given name is found.
             requests.HTTPError: If the API request fails
         """
-        url = f'{self.base_url}/members/me/boards'
-        params = {'key': self.api_key, 'token': self.token, 'fields': 'name'}
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        boards = response.json()
-
-        for board in boards:
-            if board['name'] == board_name:
-                return board['id']
-
-        raise ValueError(f"Board with name '{board_name}' not found.")
-
-    def get_board_data(self, board_name: str) -> dict[str, Any]:
+        if self._board_index is None:
+            url = f'{self.base_url}/members/me/boards'
+            params = {'fields': 'name'}
+            response = self.session.get(url, params=params, timeout=10)
+            response.raise_for_status()
+            boards = response.json()
+            # Reversed so that the first board wins when several share a name
+            self._board_index = {board['name']: board['id'] for board in reversed(boards)}
+
+        try:
+            return self._board_index[board_name]
+        except KeyError:
+            raise ValueError(f"Board with name '{board_name}' not found.") from None
+
+    def get_board_data(
+        self,
+        board_name: str,
+        fields: str | None = None,
+        list_fields: str | None = None,
+        card_fields: str = 'name,idList,desc',
+    ) -> dict[str, Any]:
         """
         Fetch comprehensive board data including lists and cards.
 
         Retrieves board information from the Trello API including all open
-        lists and cards. The response includes card names, descriptions,
-        and their associated list IDs.
+        lists and cards. By default the response includes the API's default
+        board and list fields, plus card names, descriptions and their
+        associated list IDs.
+
+        Callers that only need a few fields can narrow them down to reduce the
+        payload size.
 
         Args:
             board_name (str): The name of the Trello board.
+            fields (str, optional): Comma-separated board fields to return.
+                Defaults to the Trello API defaults.
+            list_fields (str, optional): Comma-separated list fields to return.
+                Defaults to the Trello API defaults.
+            card_fields (str, optional): Comma-separated card fields to return.
+                Defaults to "name,idList,desc".
 
         Returns:
-            Dict[str, Any]: A dictionary containing the complete board data
-                           including lists, cards, and metadata.
+            Dict[str, Any]: A dictionary containing the board data with its
+                           lists and cards. The fields present depend on
+                           fields, list_fields and card_fields.
 
         Raises:
             requests.HTTPError: If the API request fails (invalid credentials,
@@ -110,14 +139,16 @@ class TrelloClient:
         board_id = self.get_board_id_by_name(board_name)
         url = f'{self.base_url}/boards/{board_id}'
         params = {
-            'key': self.api_key,
-            'token': self.token,
             'lists': 'open',
             'cards': 'open',
-            'card_fields': 'name,idList,desc',
+            'card_fields': card_fields,
         }
+        if fields is not None:
+            params['fields'] = fields
+        if list_fields is not None:
+            params['list_fields'] = list_fields
 
-        response = requests.get(url, params=params, timeout=10)
+        response = self.session.get(url, params=params, timeout=10)
         response.raise_for_status()
         return response.json()
 
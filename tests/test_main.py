@@ -0,0 +1,128 @@
+"""Tests for Trello list extraction and Google Keep note generation."""
+
+import json
+import pathlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from trello2keep.main import ListData, ListsData, create_google_keep_note, extract_list_items, main
+from trello2keep.trello import TrelloClient
+
+BOARD = {
+    'name': 'Courses',
+    'lists': [
+        {'id': 'l1', 'name': 'Lidl', 'closed': False},
+        {'id': 'l2', 'name': 'Carrefour', 'closed': False},
+        {'id': 'l3', 'name': 'lidl', 'closed': True},
+        {'id': 'l4', 'name': 'Other', 'closed': False},
+    ],
+    'cards': [
+        {'name': 'Milk', 'idList': 'l1'},
+        {'name': 'Bread', 'idList': 'l2'},
+        {'name': 'Eggs', 'idList': 'l1'},
+        {'name': 'Archived', 'idList': 'l3'},
+        {'name': 'Ignored', 'idList': 'l4'},
+    ],
+}
+
+
+@pytest.fixture
+def credentials_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    path = tmp_path / 'credentials.json'
+    path.write_text(json.dumps({'trello': {'api_key': 'key', 'token': 'token'}}), encoding='utf-8')
+    return path
+
+
+def test_extract_list_items(credentials_path: pathlib.Path):
+    with patch.object(TrelloClient, 'get_board_data', return_value=BOARD) as get_board_data:
+        result = extract_list_items('Courses', ['LIDL', 'Carrefour', 'Whole Foods'], credentials_path)
+
+    assert result == ListsData(
+        lists=[
+            ListData(name='lidl', items=['Milk', 'Eggs']),
+            ListData(name='carrefour', items=['Bread']),
+            ListData(name='whole foods', items=[]),
+        ]
+    )
+    get_board_data.assert_called_once_with(
+        'Courses', fields='name', list_fields='name,closed', card_fields='name,idList'
+    )
+
+
+def test_extract_list_items_no_matching_list(credentials_path: pathlib.Path):
+    with patch.object(TrelloClient, 'get_board_data', return_value=BOARD):
+        result = extract_list_items('Courses', ['Missing'], credentials_path)
+
+    assert result == ListsData(lists=[ListData(name='missing', items=[])])
+
+
+def test_extract_list_items_missing_credentials(tmp_path: pathlib.Path):
+    assert extract_list_items('Courses', ['Lidl'], tmp_path / 'missing.json') is None
+
+
+def test_extract_list_items_missing_trello_credentials(tmp_path: pathlib.Path):
+    path = tmp_path / 'credentials.json'
+    path.write_text('{"type": "service_account"}', encoding='utf-8')
+
+    assert extract_list_items('Courses', ['Lidl'], path) is None
+
+
+def test_as_text():
+    lists_data = ListsData(
+        lists=[
+            ListData(name='lidl', items=['Milk', 'Eggs']),
+            ListData(name='empty', items=[]),
+            ListData(name='carrefour', items=['Bread']),
+        ]
+    )
+
+    assert lists_data.as_text() == 'LIDL\nMilk\nEggs\n\nCARREFOUR\nBread\n'
+
+
+def test_create_google_keep_note_checklist_last_duplicate_list_wins():
+    notes_api = MagicMock()
+    lists_data = ListsData(
+        lists=[
+            ListData(name='lidl', items=['Milk']),
+            ListData(name='lidl', items=['Eggs']),
+        ]
+    )
+
+    create_google_keep_note(notes_api, 'Courses', lists_data)
+
+    notes_api.create.assert_called_once_with(
+        body={
+            'title': 'Courses',
+            'body': {
+                'list': {
+                    'listItems': [
+                        {
+                            'text': {'text': 'LIDL'},
+                            'checked': False,
+                            'childListItems': [{'text': {'text': 'Eggs'}, 'checked': False}],
+                        }
+                    ]
+                }
+            },
+        }
+    )
+
+
+def test_create_google_keep_note_text():
+    notes_api = MagicMock()
+    lists_data = ListsData(lists=[ListData(name='lidl', items=['Milk'])])
+
+    create_google_keep_note(notes_api, 'Courses', lists_data, text_only=True)
+
+    notes_api.create.assert_called_once_with(body={'title': 'Courses', 'body': {'text': {'text': 'LIDL\nMilk\n'}}})
+
+
+def test_main_requires_lists(credentials_path: pathlib.Path):
+    with patch('trello2keep.main._execute_main') as execute_main:
+        result = CliRunner().invoke(main, ['--credentials', str(credentials_path), 'Courses'])
+
+    assert result.exit_code == 2
+    assert "Missing argument 'LIST_ITEMS...'" in result.output
+    execute_main.assert_not_called()
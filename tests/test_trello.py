@@ -0,0 +1,78 @@
+"""Tests for the Trello API client."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from trello2keep.trello import TrelloClient
+
+BOARDS = [
+    {'id': 'b1', 'name': 'Courses'},
+    {'id': 'b2', 'name': 'Kanban'},
+    {'id': 'b3', 'name': 'Courses'},
+]
+
+
+def _response(payload) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = payload
+    return response
+
+
+@pytest.fixture
+def client() -> TrelloClient:
+    return TrelloClient('key', 'token')
+
+
+def test_session_carries_credentials(client: TrelloClient):
+    assert client.session.params == {'key': 'key', 'token': 'token'}
+
+
+def test_get_board_id_by_name_fetches_boards_once(client: TrelloClient):
+    with patch.object(client.session, 'get', return_value=_response(BOARDS)) as get:
+        assert client.get_board_id_by_name('Kanban') == 'b2'
+        assert client.get_board_id_by_name('Courses') == 'b1'
+
+    get.assert_called_once_with('https://api.trello.com/1/members/me/boards', params={'fields': 'name'}, timeout=10)
+
+
+def test_get_board_id_by_name_first_match_wins(client: TrelloClient):
+    with patch.object(client.session, 'get', return_value=_response(BOARDS)):
+        assert client.get_board_id_by_name('Courses') == 'b1'
+
+
+def test_get_board_id_by_name_unknown_board(client: TrelloClient):
+    with (
+        patch.object(client.session, 'get', return_value=_response(BOARDS)),
+        pytest.raises(ValueError, match="Board with name 'Missing' not found."),
+    ):
+        client.get_board_id_by_name('Missing')
+
+
+def test_get_board_data_default_fields(client: TrelloClient):
+    board = {'name': 'Kanban', 'lists': [], 'cards': []}
+    with patch.object(client.session, 'get', side_effect=[_response(BOARDS), _response(board)]) as get:
+        assert client.get_board_data('Kanban') == board
+
+    get.assert_called_with(
+        'https://api.trello.com/1/boards/b2',
+        params={'lists': 'open', 'cards': 'open', 'card_fields': 'name,idList,desc'},
+        timeout=10,
+    )
+
+
+def test_get_board_data_custom_fields(client: TrelloClient):
+    with patch.object(client.session, 'get', side_effect=[_response(BOARDS), _response({})]) as get:
+        client.get_board_data('Kanban', fields='name', list_fields='name,closed', card_fields='name,idList')
+
+    get.assert_called_with(
+        'https://api.trello.com/1/boards/b2',
+        params={
+            'lists': 'open',
+            'cards': 'open',
+            'card_fields': 'name,idList',
+            'fields': 'name',
+            'list_fields': 'name,closed',
+        },
+        timeout=10,
+    )